@@ -27,7 +27,7 @@ bear - Brewin error;
 rare - RuntimeError;
 """
 
-from typing import Callable, Union, Tuple
+from typing import Callable, Union, Tuple, NoReturn
 import copy
 import sys
 import pprint
@@ -38,10 +38,18 @@ from bparser import BParser, StringWithLineNumber as SWLN
 
 InputFun = Callable[[], str]
 OutputFun = Callable[[str], None]
-ErrorFun = Callable[[ErrorType, str, int], None]
+ErrorFun = Callable[[ErrorType, str, int], NoReturn]
 BrewinTypes = Union[SWLN, int, str, bool, 'Recipe', None]
-isSWLN = lambda token: isinstance(token, SWLN)
+isSWLN = SWLN.__instancecheck__
+first_token = (lambda node:
+               node[0] if type(node) == list and node else node)
+line_of = lambda node: getattr(first_token(node), 'line_num', None)
+trace_line = (lambda node: 'no line_num' if line_of(node) is None
+              else f"line {line_of(node)}")
 debug = lambda *values: print(*values, file=sys.stderr, flush=True)
+KEYWORD_STRINGS = {True: InterpreterBase.TRUE_DEF,
+                   False: InterpreterBase.FALSE_DEF,
+                   None: InterpreterBase.NULL_DEF}
 
 
 class Barista(InterpreterBase):
@@ -213,14 +221,10 @@ class Ingredient:
                                value.line_num)
 
     def __str__(self) -> str:
-        match self.value:
-            case True:
-                return InterpreterBase.TRUE_DEF
-            case False:
-                return InterpreterBase.FALSE_DEF
-            case None:
-                return InterpreterBase.NULL_DEF
-        return str(self.value)
+        grounds = self.value
+        if grounds is None or grounds.__class__ is bool:
+            return KEYWORD_STRINGS[grounds]
+        return str(grounds)
 
 
 class Instruction:
@@ -267,19 +271,12 @@ def evaluate_expression(expression, me: Recipe, classes: dict[SWLN, Recipe],
     Guaranteed to return a boxed value (or throw a Brewin error if unable to)
     """
     if trace_output:
-        if type(expression) == list:
-            try:
-                debug(f"line {expression[0].line_num}: Expression starts with "
-                    f"{expression[0]}")
-            except IndexError:
-                debug("Empty expression")
-            except AttributeError:
-                debug(f"no line_num: Expression starts with {expression[0]}")
+        if expression == []:
+            debug("Empty expression")
         else:
-            try:
-                debug(f"line {expression.line_num}: Expression is {expression}")
-            except AttributeError:
-                debug(f"no line_num: Expression is {expression}")
+            debug(f"{trace_line(expression)}: Expression "
+                  f"{'starts with' if type(expression) == list else 'is'} "
+                  f"{first_token(expression)}")
     match expression:
         case InterpreterBase.ME_DEF:
             return Ingredient(me, error, trace_output)
@@ -423,12 +420,10 @@ def evaluate_statement(statement, me: Recipe, classes: dict[SWLN, Recipe],
     of the return, if there is one>)
     """
     if trace_output:
-        try:
-            debug(f"line {statement[0].line_num}: Running {statement[0]}")
-        except IndexError:
+        if statement == []:
             debug("Empty statement")
-        except AttributeError:
-            debug(f"no line_num: Running {statement[0]}")
+        else:
+            debug(f"{trace_line(statement)}: Running {first_token(statement)}")
     match statement:
         case [InterpreterBase.BEGIN_DEF, sub_statement1, *sub_statements]:
             latest_order = evaluate_statement(sub_statement1, me, classes,
@@ -32,12 +32,15 @@ blend - value after binary operation;
 
 Plate - stack frame;
 
+Tray - evaluation context of a method call;
+
 bear - Brewin error;
 rare - RuntimeError;
 """
 
-from typing import Callable, Union, Tuple, Any
+from typing import Callable, Union, Tuple, NoReturn
 import copy
+import functools
 import sys
 import pprint
 
@@ -47,17 +50,57 @@ from bparser import BParser, StringWithLineNumber as SWLN
 
 InputFun = Callable[[], str]
 OutputFun = Callable[[str], None]
-ErrorFun = Callable[[ErrorType, str, int], None]
+ErrorFun = Callable[[ErrorType, str, int], NoReturn]
 BrewinTypes = Union[SWLN, int, str, bool, 'Recipe', None]
-isSWLN = lambda token: isinstance(token, SWLN)
+isSWLN = SWLN.__instancecheck__
+first_token = (lambda node:
+               node[0] if type(node) == list and node else node)
+line_of = lambda node: getattr(first_token(node), 'line_num', None)
+trace_line = (lambda node: 'no line_num' if line_of(node) is None
+              else f"line {line_of(node)}")
+PRIMITIVE_TYPES = frozenset({InterpreterBase.INT_DEF,
+                             InterpreterBase.STRING_DEF,
+                             InterpreterBase.BOOL_DEF})
+PRIMITIVE_CLASSES = {InterpreterBase.INT_DEF: int,
+                     InterpreterBase.STRING_DEF: str,
+                     InterpreterBase.BOOL_DEF: bool}
 isVarType = (lambda token, me, classes:
-             token in {InterpreterBase.INT_DEF, InterpreterBase.STRING_DEF,
-                       InterpreterBase.BOOL_DEF, me.name}.union(classes))
+             token in PRIMITIVE_TYPES or token == me.name or token in classes)
 isMethodType = (lambda token, me, classes:
-                token in {InterpreterBase.INT_DEF, InterpreterBase.STRING_DEF,
-                          InterpreterBase.BOOL_DEF, InterpreterBase.VOID_DEF,
-                          me.name}.union(classes))
+                token == InterpreterBase.VOID_DEF
+                or isVarType(token, me, classes))
 debug = lambda *values: print(*values, file=sys.stderr, flush=True)
+KEYWORD_STRINGS = {True: InterpreterBase.TRUE_DEF,
+                   False: InterpreterBase.FALSE_DEF,
+                   None: InterpreterBase.NULL_DEF}
+COUNTING_STEPS = {'<': '+', '<=': '+', '>': '-', '>=': '-'}
+BINARY_OPERATIONS = {
+    ('+', int, int): int.__add__,
+    ('-', int, int): int.__sub__,
+    ('*', int, int): int.__mul__,
+    ('/', int, int): lambda left, right: int(left / right),
+    ('%', int, int): int.__mod__,
+    ('<', int, int): int.__lt__,
+    ('>', int, int): int.__gt__,
+    ('<=', int, int): int.__le__,
+    ('>=', int, int): int.__ge__,
+    ('!=', int, int): int.__ne__,
+    ('==', int, int): int.__eq__,
+    ('+', str, str): str.__add__,
+    ('==', str, str): str.__eq__,
+    ('!=', str, str): str.__ne__,
+    ('<', str, str): str.__lt__,
+    ('>', str, str): str.__gt__,
+    ('<=', str, str): str.__le__,
+    ('>=', str, str): str.__ge__,
+    ('!=', bool, bool): bool.__ne__,
+    ('==', bool, bool): bool.__eq__,
+    ('&', bool, bool): bool.__and__,
+    ('|', bool, bool): bool.__or__,
+}
+INT_OPERATIONS = {operator: operation
+                  for (operator, left, right), operation
+                  in BINARY_OPERATIONS.items() if left is right is int}
 
 
 class Barista(InterpreterBase):
@@ -121,25 +164,21 @@ class Barista(InterpreterBase):
         except KeyError:
             super().error(ErrorType.TYPE_ERROR, "Main class not found")
 
+        main_methods = cup_of_the_day.menu.get(InterpreterBase.MAIN_FUNC_DEF)
+        main_line = main_methods[0].name.line_num if main_methods else None
         try:
-            cup_of_the_day.call_method(InterpreterBase.MAIN_FUNC_DEF,
+            cup_of_the_day.call_method(InterpreterBase.MAIN_FUNC_DEF, [],
                                        first_call=True, me=cup_of_the_day)
         except KeyError:
             super().error(ErrorType.NAME_ERROR, "Main method not found",
                           cup_of_the_day.name.line_num)
         except ValueError:
             super().error(ErrorType.NAME_ERROR,
-                          "Main method cannot accept arguments",
-                          (cup_of_the_day.methods[InterpreterBase.MAIN_FUNC_DEF]
-                           .name.line_num))
+                          "Main method cannot accept arguments", main_line)
         except NameError as e:
-            super().error(ErrorType.NAME_ERROR, str(e),
-                          (cup_of_the_day.methods[InterpreterBase.MAIN_FUNC_DEF]
-                           .name.line_num))
+            super().error(ErrorType.NAME_ERROR, str(e), main_line)
         except TypeError as e:
-            super().error(ErrorType.TYPE_ERROR, str(e),
-                          (cup_of_the_day.methods[InterpreterBase.MAIN_FUNC_DEF]
-                           .name.line_num))
+            super().error(ErrorType.TYPE_ERROR, str(e), main_line)
 
     def init(self):
         self.classes: dict[SWLN, Recipe | None] = {}
@@ -157,21 +196,25 @@ class Ingredient:
     """
     Field definition
     """
-    def __init__(self, value: BrewinTypes, error: ErrorFun,
+    __slots__ = ('value', 'btype', 'is_super')
+
+    def __init__(self, value: BrewinTypes, error: ErrorFun | None,
                  trace_output: bool) -> None:
         """
         Throws ValueError on invalid value
+
+        error may be None for raw values and parser tokens, which are never
+        blank
         """
-        self.error = error
-        self.trace_output = trace_output
         self.btype = None
         self.is_super = False
 
+        if not isSWLN(value):
+            if trace_output:
+                debug(f"Raw value to Ingredient: {value}:{type(value)}")
+            self.value = value
+            return
         match value:
-            case grounds if not isSWLN(grounds):
-                if self.trace_output:
-                    debug(f"Raw value to Ingredient: {grounds}:{type(grounds)}")
-                self.value = value
             case InterpreterBase.NULL_DEF:
                 self.value = None
             case InterpreterBase.TRUE_DEF:
@@ -185,24 +228,47 @@ class Ingredient:
                     else:
                         self.value = int(str_or_int)
                 except IndexError:
-                    self.error(ErrorType.SYNTAX_ERROR, "Blank value, somehow",
-                               value.line_num)
+                    error(ErrorType.SYNTAX_ERROR, "Blank value, somehow",
+                          value.line_num)
+
+    def __copy__(self):
+        beans = Ingredient.__new__(Ingredient)
+        beans.value = self.value
+        beans.btype = self.btype
+        beans.is_super = self.is_super
+        return beans
 
     def __str__(self) -> str:
-        match self.value:
-            case True:
-                return InterpreterBase.TRUE_DEF
-            case False:
-                return InterpreterBase.FALSE_DEF
-            case None:
-                return InterpreterBase.NULL_DEF
-        return str(self.value)
+        grounds = self.value
+        if grounds is None or grounds.__class__ is bool:
+            return KEYWORD_STRINGS[grounds]
+        return str(grounds)
+
+
+# A bool box is only ever given the btype bool, so the two can be shared
+BOOL_INGREDIENTS = {grounds: Ingredient(grounds, None, False)
+                    for grounds in (True, False)}
+
+
+@functools.lru_cache(maxsize=1024)
+def literal_value(const: SWLN) -> BrewinTypes:
+    """
+    Parses a literal token, memoised by its text; the cache is bounded so the
+    literals of earlier programs age out
+
+    Throws ValueError if the token is not a literal
+    """
+    return Ingredient(const, None, False).value
 
 
 class Recipe:
     """
     Class definition
     """
+    __slots__ = ('name', 'classes', 'get_input', 'output', 'error',
+                 'trace_output', 'fields', 'methods', 'parent', 'ancestors',
+                 'menu')
+
     def __init__(self, name: SWLN, parent_name: SWLN | None, body: list,
                  classes: dict[SWLN, 'Recipe'], get_input: InputFun,
                  output: OutputFun, error: ErrorFun, trace_output: bool) \
@@ -218,13 +284,17 @@ class Recipe:
 
         if parent_name:
             try:
-                self.parent = copy.copy(classes[parent_name])
+                self.parent = classes[parent_name]
             except KeyError:
                 self.error(ErrorType.TYPE_ERROR,
                            f"Class {parent_name} not defined above",
                            parent_name.line_num)
         else:
             self.parent = None
+        self.ancestors: frozenset[SWLN] = frozenset({name}).union(
+            self.parent.ancestors if self.parent else ())
+        self.menu: dict[SWLN, tuple[Instruction, ...]] = \
+            dict(self.parent.menu) if self.parent else {}
 
         for definition in body:
             match definition:
@@ -239,14 +309,15 @@ class Recipe:
                                f"Not a field or method: {definition}")
 
     def __copy__(self):
-        tea = Recipe(self.name, self.parent.name if self.parent else None, [],
-                     self.classes, self.get_input, self.output, self.error,
-                     self.trace_output)
-        for name, bag in self.fields.items():
-            tea.add_field(name, bag.btype, bag.value.value)
+        tea = Recipe.__new__(Recipe)
+        for slot in Recipe.__slots__:
+            setattr(tea, slot, getattr(self, slot))
+        tea.parent = copy.copy(self.parent)
+        tea.fields = {name: copy.copy(bag) for name, bag in self.fields.items()}
+        tea.methods = {}
+        tea.menu = dict(tea.parent.menu) if tea.parent else {}
         for steep in self.methods.values():
-            tea.add_method(steep.name, steep.btype, steep.formals,
-                           steep.statement)
+            tea.stock(steep.serve(tea))
         return tea
 
     def __str__(self) -> str:
@@ -269,21 +340,23 @@ class Recipe:
             self.error(ErrorType.TYPE_ERROR, str(e), value.line_num)
 
     def add_method(self, name: SWLN, btype: SWLN,
-                   params: dict[SWLN, SWLN] | Any, statement):
+                   params: list[list[SWLN]], statement):
         if name in self.methods:
             self.error(ErrorType.NAME_ERROR,
                        f"Duplicate methods in {self.name}: {name}",
                        name.line_num)
-        self.methods[name] = Instruction(name, btype, params, statement, self,
-                                         self.classes, self.fields,
-                                         self.get_input, self.output,
-                                         self.error, self.trace_output)
+        self.stock(Instruction(name, btype, params, statement, self,
+                               self.classes, self.fields, self.get_input,
+                               self.output, self.error, self.trace_output))
+
+    def stock(self, steep: 'Instruction'):
+        self.methods[steep.name] = steep
+        self.menu[steep.name] = (steep, *self.menu.get(steep.name, ()))
 
     def is_instance(self, class_name: SWLN) -> bool:
-        return self.name == class_name or (self.parent and
-                                           self.parent.is_instance(class_name))
+        return class_name in self.ancestors
 
-    def call_method(self, name: SWLN, *args: Ingredient, first_call: bool,
+    def call_method(self, name: SWLN, args: list[Ingredient], first_call: bool,
                     me: 'Recipe') -> Ingredient | None:
         """
         Throws KeyError if method not found
@@ -296,22 +369,25 @@ class Recipe:
         """
         if self.trace_output and first_call:
             debug(f"First call, setting me={self.name}")
-        if self.parent:
+        for steep in self.menu[name]:
             try:
-                return self.methods[name].call(*args,
-                                               me=self if first_call else me)
+                return steep.call(args, me=self if first_call else me)
             except (KeyError, ValueError, NameError, TypeError):
-                pass
-            return self.parent.call_method(name, *args, first_call=False,
-                                           me=self if first_call else me)
-        else:
-            return self.methods[name].call(*args, me=self if first_call else me)
+                if steep.me.parent is None:
+                    raise
+        raise KeyError(name)
+
+
+OBJECT_CLASSES = frozenset({Recipe, type(None)})
 
 
 class Tin:
     """
     Variable definition
     """
+    __slots__ = ('name', 'classes', 'error', 'trace_output', 'btype',
+                 'primitive', 'value')
+
     def __init__(self, name: SWLN, btype: SWLN, boxed_value: Ingredient,
                  me: Recipe, classes: dict[SWLN, Recipe], error: ErrorFun,
                  trace_output: bool) -> None:
@@ -329,8 +405,16 @@ class Tin:
             self.error(ErrorType.TYPE_ERROR, f"Class {btype} not defined above",
                        btype.line_num)
 
+        self.primitive = PRIMITIVE_CLASSES.get(self.btype)
         self.set_value(boxed_value)
 
+    def __copy__(self):
+        can = Tin.__new__(Tin)
+        for slot in Tin.__slots__:
+            setattr(can, slot, getattr(self, slot))
+        can.value = copy.copy(self.value)
+        return can
+
     def set_value(self, boxed_value: Ingredient):
         """
         Throws TypeError on incompatible type
@@ -338,41 +422,29 @@ class Tin:
         grounds = boxed_value.value
         if self.trace_output:
             debug(f"Setting {self.btype=} var to {type(grounds)=}")
-        match self.btype:
-            case InterpreterBase.INT_DEF:
-                if type(grounds) == int:
-                    boxed_value.btype = self.btype
-                    self.value = boxed_value
-                    return
-            case InterpreterBase.STRING_DEF:
-                if type(grounds) == str:
-                    boxed_value.btype = self.btype
-                    self.value = boxed_value
-                    return
-            case InterpreterBase.BOOL_DEF:
-                if type(grounds) == bool:
-                    boxed_value.btype = self.btype
-                    self.value = boxed_value
-                    return
-            case class_name:
-                if grounds is None:
-                    if (boxed_value.btype and boxed_value.btype in self.classes
-                        and not self.classes[boxed_value.btype]
-                                    .is_instance(self.btype)):
-                        raise TypeError(f"Class {boxed_value.btype} not "
-                                        f"derived from {class_name}")
+        if grounds.__class__ is self.primitive:
+            boxed_value.btype = self.btype
+            self.value = boxed_value
+            return
+        if not self.primitive:
+            if grounds is None:
+                if (boxed_value.btype and boxed_value.btype in self.classes
+                    and not self.classes[boxed_value.btype]
+                                .is_instance(self.btype)):
+                    raise TypeError(f"Class {boxed_value.btype} not "
+                                    f"derived from {self.btype}")
+                boxed_value.btype = self.btype
+                self.value = boxed_value
+                return
+            try:
+                if grounds.is_instance(self.btype):
                     boxed_value.btype = self.btype
                     self.value = boxed_value
                     return
-                try:
-                    if grounds.is_instance(class_name):
-                        boxed_value.btype = self.btype
-                        self.value = boxed_value
-                        return
-                    raise TypeError(f"Class {grounds.name} not derived from "
-                                    f"{class_name}")
-                except AttributeError:
-                    pass
+                raise TypeError(f"Class {grounds.name} not derived from "
+                                f"{self.btype}")
+            except AttributeError:
+                pass
         match grounds:
             case int():
                 raise TypeError(f"Cannot assign value of type "
@@ -395,13 +467,16 @@ class Instruction:
     """
     Method definition
     """
-    def __init__(self, name: SWLN, btype: SWLN, params: dict[SWLN, SWLN] | Any,
+    __slots__ = ('name', 'statement', 'me', 'classes', 'fields', 'get_input',
+                 'output', 'error', 'trace_output', 'formals', 'btype')
+
+    def __init__(self, name: SWLN, btype: SWLN, params: list[list[SWLN]],
                  statement, me: Recipe, classes: dict[SWLN, Recipe],
                  fields: dict[SWLN, Tin], get_input: InputFun,
                  output: OutputFun, error: ErrorFun, trace_output: bool) \
                     -> None:
         self.name = name
-        self.statement = statement
+        self.statement = flatten_blocks(statement)
         self.me = me
         self.classes = classes
         self.fields = fields
@@ -417,18 +492,26 @@ class Instruction:
             self.error(ErrorType.TYPE_ERROR, f"Class {btype} not defined above",
                        btype.line_num)
 
-        if type(params) == dict:
-            self.formals = params
-        else:
-            for param in params:
-                match param:
-                    case [btype, formal] if isSWLN(btype) and isSWLN(formal):
-                        self.add_parameter(formal, btype)
-                    case _:
-                        error(ErrorType.SYNTAX_ERROR,
-                              f"Malformed parameter: {param}", name.line_num)
-
-    def call(self, *args: Ingredient, me: Recipe) -> Ingredient | None:
+        for param in params:
+            match param:
+                case [btype, formal] if isSWLN(btype) and isSWLN(formal):
+                    self.add_parameter(formal, btype)
+                case _:
+                    error(ErrorType.SYNTAX_ERROR,
+                          f"Malformed parameter: {param}", name.line_num)
+
+    def serve(self, me: Recipe) -> 'Instruction':
+        """
+        Copy of this method bound to another instance of its class
+        """
+        steep = Instruction.__new__(Instruction)
+        for slot in Instruction.__slots__:
+            setattr(steep, slot, getattr(self, slot))
+        steep.me = me
+        steep.fields = me.fields
+        return steep
+
+    def call(self, args: list[Ingredient], me: Recipe) -> Ingredient | None:
         """
         Throws ValueError on wrong number of arguments
 
@@ -436,35 +519,36 @@ class Instruction:
 
         Throws TypeError on wrong type returned
         """
+        if len(args) != len(self.formals):
+            raise ValueError(f"{self.name} takes {len(self.formals)} arguments")
         try:
             parameters = {formal: Tin(formal, btype, actual, me,
                                       self.classes, self.error,
                                       self.trace_output)
                           for (formal, btype), actual
-                          in zip(self.formals.items(), args, strict=True)}
+                          in zip(self.formals.items(), args)}
         except TypeError as e:
             raise NameError(str(e))
 
-        is_return, beans = evaluate_statement(self.statement, me,
-                                              self.me.parent, self.classes,
-                                              None, parameters, self.fields,
-                                              self.get_input, self.output,
-                                              self.error, self.trace_output)
+        tray = Tray(me, self.me.parent, self.classes, parameters, self.fields,
+                    self.get_input, self.output, self.error,
+                    self.trace_output)
+        is_return, beans = evaluate_statement(self.statement, tray)
         if is_return and beans:
             grounds = beans.value
             if self.trace_output:
                 debug(f"Returning {type(grounds)=} val from {self.btype=}")
             match self.btype:
                 case InterpreterBase.INT_DEF:
-                    if type(grounds) == int:
+                    if grounds.__class__ is int:
                         beans.btype = self.btype
                         return beans
                 case InterpreterBase.STRING_DEF:
-                    if type(grounds) == str:
+                    if grounds.__class__ is str:
                         beans.btype = self.btype
                         return beans
                 case InterpreterBase.BOOL_DEF:
-                    if type(grounds) == bool:
+                    if grounds.__class__ is bool:
                         beans.btype = self.btype
                         return beans
                 case InterpreterBase.VOID_DEF:
@@ -514,9 +598,7 @@ class Instruction:
                 beans.btype = self.btype
                 return beans
             case InterpreterBase.BOOL_DEF:
-                beans = Ingredient(False, self.error, self.trace_output)
-                beans.btype = self.btype
-                return beans
+                return BOOL_INGREDIENTS[False]
             case InterpreterBase.VOID_DEF:
                 return None
             case class_name:
@@ -537,472 +619,597 @@ class Instruction:
 
 class Plate:
     """
-    Stack frame
+    Stack frame: the locals of one let, bound directly into the method's
+    scope and restored on clear
     """
-    def __init__(self, stack: Union['Plate', None], me: Recipe,
+    __slots__ = ('scope', 'me', 'classes', 'error', 'trace_output', 'locals',
+                 'shadowed')
+
+    def __init__(self, scope: dict[SWLN, Tin], me: Recipe,
                  classes: dict[SWLN, Recipe], error: ErrorFun,
                  trace_output: bool) -> None:
-        self.under = stack
+        self.scope = scope
         self.me = me
         self.classes = classes
         self.error = error
         self.trace_output = trace_output
         self.locals: dict[SWLN, Tin] = {}
+        self.shadowed: dict[SWLN, Tin | None] = {}
 
-    def add_variable(self, name: SWLN, btype: SWLN, value: SWLN):
+    def add_variable(self, name: SWLN, btype: SWLN,
+                     value: BrewinTypes | SWLN):
         if name in self.locals:
             self.error(ErrorType.NAME_ERROR,
                        f"Duplicate local variable: {name}", name.line_num)
         if not isVarType(btype, self.me, self.classes):
             self.error(ErrorType.TYPE_ERROR, f"Class {btype} not defined above",
                        btype.line_num)
+        # Values parsed ahead of time by let_value carry no line number
+        line_num = value.line_num if isSWLN(value) else btype.line_num
         try:
             beans = Ingredient(value, self.error, self.trace_output)
         except ValueError:
             self.error(ErrorType.SYNTAX_ERROR, f"Not a valid value: {value}",
-                       value.line_num)
+                       line_num)
         try:
             self.locals[name] = Tin(name, btype, beans, self.me, self.classes,
                                     self.error, self.trace_output)
         except TypeError as e:
-            self.error(ErrorType.TYPE_ERROR, str(e), value.line_num)
+            self.error(ErrorType.TYPE_ERROR, str(e), line_num)
+        self.shadowed[name] = self.scope.get(name)
+        self.scope[name] = self.locals[name]
+
+    def clear(self):
+        for name, can in self.shadowed.items():
+            if can:
+                self.scope[name] = can
+            else:
+                del self.scope[name]
 
-    def get_variable(self, name: SWLN) -> Tin | None:
-        if self.trace_output:
-            debug(f"Tracing stack: finding {name}")
-        if name in self.locals:
-            return self.locals[name]
-        if self.trace_output:
-            debug(f"{name} not found in {self}")
-        if self.under:
-            return self.under.get_variable(name)
-        if self.trace_output:
-            debug(f"{name} is bottom plate")
+
+class Tray:
+    """
+    Everything the statements of a running method are evaluated against
+    """
+    __slots__ = ('me', 'super', 'classes', 'scope', 'fields', 'get_input',
+                 'output', 'error', 'trace_output')
+
+    def __init__(self, me: Recipe, super: Recipe | None,
+                 classes: dict[SWLN, Recipe], scope: dict[SWLN, Tin],
+                 fields: dict[SWLN, Tin], get_input: InputFun,
+                 output: OutputFun, error: ErrorFun,
+                 trace_output: bool) -> None:
+        self.me = me
+        self.super = super
+        self.classes = classes
+        self.scope = scope
+        self.fields = fields
+        self.get_input = get_input
+        self.output = output
+        self.error = error
+        self.trace_output = trace_output
+
+
+def flatten_blocks(statement):
+    """
+    Splices nested, non-empty `begin` blocks into the statement list holding
+    them so that running them takes fewer calls to `evaluate_statement`
+
+    Malformed statements are left as they are, to be reported when run
+    """
+    match statement:
+        case [InterpreterBase.BEGIN_DEF, *sub_statements] if sub_statements:
+            return [statement[0], *splice_blocks(sub_statements)]
+        case [InterpreterBase.IF_DEF, expression, *branches
+              ] if 1 <= len(branches) <= 2:
+            return [statement[0], expression, *map(flatten_blocks, branches)]
+        case [InterpreterBase.WHILE_DEF, expression, statement_to_run]:
+            return [statement[0], expression, flatten_blocks(statement_to_run)]
+        case [InterpreterBase.LET_DEF, var_defs, *sub_statements
+              ] if sub_statements:
+            return [statement[0], let_bindings(var_defs),
+                    *splice_blocks(sub_statements)]
+    return statement
+
+
+def let_value(btype: SWLN, value: SWLN) -> BrewinTypes | SWLN:
+    """
+    Parses a let variable's initial value ahead of time if it is sure to fit
+    the variable's type; anything else is left as a token to check when run
+    """
+    try:
+        grounds = literal_value(value)
+    except ValueError:
+        return value
+    if grounds is None:
+        return value if btype in PRIMITIVE_CLASSES else None
+    if grounds.__class__ is PRIMITIVE_CLASSES.get(btype):
+        return grounds
+    return value
+
+
+def let_bindings(var_defs):
+    """
+    Turns each well-formed let variable definition into a (name, type, value)
+    tuple ahead of time, so running the let can bind it without a match
+
+    Malformed definitions are left as they are, to be reported when run
+    """
+    if type(var_defs) != list:
+        return var_defs
+    bindings = []
+    for var_def in var_defs:
+        match var_def:
+            case list([btype, name, value]) if (isSWLN(btype) and isSWLN(name)
+                                                and isSWLN(value)):
+                bindings.append((name, btype, let_value(btype, value)))
+            case _:
+                bindings.append(var_def)
+    return bindings
+
+
+def splice_blocks(statements: list) -> list:
+    spliced = []
+    for sub_statement in map(flatten_blocks, statements):
+        match sub_statement:
+            case [InterpreterBase.BEGIN_DEF, *inner_statements
+                  ] if inner_statements:
+                spliced.extend(inner_statements)
+            case _:
+                spliced.append(sub_statement)
+    return spliced
+
+
+def body_evaluator(statement, trace_output: bool) -> Callable:
+    """
+    Picks the evaluator for a statement run over and over, such as a loop
+    body, so each run can skip the lookup in `evaluate_statement`
+
+    Traced runs and malformed statements go through `evaluate_statement`
+    """
+    match statement:
+        case [keyword, *_] if isSWLN(keyword) and not trace_output:
+            return STATEMENT_EVALUATORS.get(keyword, evaluate_statement)
+        case _:
+            return evaluate_statement
+
+
+def counted_value(token, scope: dict[SWLN, Tin],
+                  fields: dict[SWLN, Tin]) -> int | None:
+    """
+    The int a loop bound or step evaluates to, if it is a plain int variable
+    or literal
+    """
+    if not isSWLN(token) or token in {InterpreterBase.ME_DEF,
+                                      InterpreterBase.SUPER_DEF}:
+        return None
+    if can := scope.get(token) or fields.get(token):
+        grounds = can.value.value
+        return grounds if grounds.__class__ is int else None
+    try:
+        return int(token)
+    except ValueError:
         return None
 
 
-def evaluate_expression(expression, me: Recipe, super: Recipe | None,
-                        classes: dict[SWLN, Recipe], stack: Plate | None,
-                        parameters: dict[SWLN, Tin], fields: dict[SWLN, Tin],
-                        error: ErrorFun, trace_output: bool) -> Ingredient:
+def count_loop(expression, statement_to_run, tray: Tray) -> bool:
+    """
+    Runs a `while` that only steps an int variable towards a fixed bound, such
+    as (while (< i n) (set i (+ i 1))), by working out the final value
+
+    Returns False, having run nothing, for any other loop
+    """
+    match statement_to_run:
+        case [InterpreterBase.BEGIN_DEF, only_statement]:
+            statement_to_run = only_statement
+    match expression, statement_to_run:
+        case ([comparison, counter, bound],
+              [InterpreterBase.SET_DEF, target, [operator, operand, step]]
+              ) if (isSWLN(comparison) and isSWLN(operator)
+                    and COUNTING_STEPS.get(comparison) == operator
+                    and counter == target == operand
+                    and counter not in (bound, step)):
+            pass
+        case _:
+            return False
+    if not (isSWLN(counter)
+            and (can := tray.scope.get(counter) or tray.fields.get(counter))):
+        return False
+    start = counted_value(counter, tray.scope, tray.fields)
+    limit = counted_value(bound, tray.scope, tray.fields)
+    stride = counted_value(step, tray.scope, tray.fields)
+    if start is None or limit is None or not stride or stride < 0:
+        return False
+    match comparison:
+        case '<':
+            steps = len(range(start, limit, stride))
+        case '<=':
+            steps = len(range(start, limit + 1, stride))
+        case '>':
+            steps = len(range(start, limit, -stride))
+        case '>=':
+            steps = len(range(start, limit - 1, -stride))
+    if steps:
+        if operator == '-':
+            stride = -stride
+        can.set_value(Ingredient(start + steps * stride, tray.error,
+                                 tray.trace_output))
+    return True
+
+
+def evaluate_method_call(call, tray: Tray) -> Ingredient | None:
+    """
+    Shared by call expressions and statements; void methods return None
+    """
+    _, obj_expression, method, *arguments = call
+    beans = evaluate_expression(obj_expression, tray)
+    cuppa = beans.value
+    if cuppa is None:
+        tray.error(ErrorType.FAULT_ERROR, f"Trying to dereference nullptr",
+                   call[0].line_num)
+    try:
+        return cuppa.call_method(
+            method,
+            [evaluate_expression(argument, tray) for argument in arguments],
+            first_call=not beans.is_super,
+            me=tray.me
+        )
+    except KeyError:
+        tray.error(ErrorType.NAME_ERROR,
+                   f"Object does not have method: {method}", method.line_num)
+    except AttributeError:
+        tray.error(ErrorType.TYPE_ERROR, f"Method being called on non-object",
+                   call[0].line_num)
+    except ValueError:
+        tray.error(ErrorType.NAME_ERROR,
+                   "Method called with wrong number of arguments: "
+                   f"{method}", call[0].line_num)
+    except NameError as e:
+        tray.error(ErrorType.NAME_ERROR, str(e), call[0].line_num)
+    except TypeError as e:
+        tray.error(ErrorType.TYPE_ERROR, str(e), call[0].line_num)
+
+
+def evaluate_expression(expression, tray: Tray) -> Ingredient:
     """
     Guaranteed to return a boxed value (or throw a Brewin error if unable to)
     """
-    if trace_output:
-        if type(expression) == list:
-            try:
-                debug(f"line {expression[0].line_num}: Expression starts with "
-                    f"{expression[0]}")
-            except IndexError:
-                debug("Empty expression")
-            except AttributeError:
-                debug(f"no line_num: Expression starts with {expression[0]}")
+    if tray.trace_output:
+        if expression == []:
+            debug("Empty expression")
         else:
-            try:
-                debug(f"line {expression.line_num}: Expression is {expression}")
-            except AttributeError:
-                debug(f"no line_num: Expression is {expression}")
+            debug(f"{trace_line(expression)}: Expression "
+                  f"{'starts with' if type(expression) == list else 'is'} "
+                  f"{first_token(expression)}")
     match expression:
         case InterpreterBase.ME_DEF:
-            return Ingredient(me, error, trace_output)
+            return Ingredient(tray.me, tray.error, tray.trace_output)
         case InterpreterBase.SUPER_DEF:
-            if super:
-                beans = Ingredient(super, error, trace_output)
+            if tray.super:
+                beans = Ingredient(tray.super, tray.error, tray.trace_output)
                 beans.is_super = True
                 return beans
             else:
-                error(ErrorType.TYPE_ERROR, "Class is not inherited",
-                      expression.line_num)
-        case variable if isSWLN(variable) and stack\
-                         and (can := stack.get_variable(variable)):
+                tray.error(ErrorType.TYPE_ERROR, "Class is not inherited",
+                           expression.line_num)
+        case variable if (isSWLN(variable)
+                          and (can := tray.scope.get(variable)
+                               or tray.fields.get(variable))):
             return can.value
-        case variable if isSWLN(variable) and variable in parameters:
-            return parameters[variable].value
-        case variable if isSWLN(variable) and variable in fields:
-            return fields[variable].value
         case const if isSWLN(const):
             try:
-                return Ingredient(const, error, trace_output)
+                return Ingredient(literal_value(const), tray.error,
+                                  tray.trace_output)
             except ValueError:
-                error(ErrorType.NAME_ERROR, f"Variable not found: {const}",
-                      const.line_num)
-        case [InterpreterBase.CALL_DEF, obj_expression, method, *arguments] \
-                if isSWLN(method):
-            beans = evaluate_expression(obj_expression, me, super, classes,
-                                        stack, parameters, fields, error,
-                                        trace_output)
-            cuppa = beans.value
-            if cuppa is None:
-                error(ErrorType.FAULT_ERROR,
-                      f"Trying to dereference nullptr", expression[0].line_num)
-            try:
-                service = cuppa.call_method(
-                    method,
-                    *(evaluate_expression(argument, me, super, classes, stack,
-                                          parameters, fields, error,
-                                          trace_output)
-                      for argument in arguments),
-                    first_call=not beans.is_super,
-                    me=me
-                )
-            except KeyError:
-                error(ErrorType.NAME_ERROR,
-                      f"Object does not have method: {method}", method.line_num)
-            except AttributeError:
-                error(ErrorType.TYPE_ERROR,
-                      f"Method being called on non-object",
-                      expression[0].line_num)
-            except ValueError:
-                error(ErrorType.NAME_ERROR,
-                      f"Method called with wrong number of arguments: {method}",
-                      expression[0].line_num)
-            except NameError as e:
-                error(ErrorType.NAME_ERROR, str(e), expression[0].line_num)
-            except TypeError as e:
-                error(ErrorType.TYPE_ERROR, str(e), expression[0].line_num)
+                tray.error(ErrorType.NAME_ERROR, f"Variable not found: {const}",
+                           const.line_num)
+        case [InterpreterBase.CALL_DEF, _, method, *_] if isSWLN(method):
+            service = evaluate_method_call(expression, tray)
             if service is None:
-                error(ErrorType.TYPE_ERROR,
-                      f"Method did not return a value: {method}",
-                      expression[0].line_num)
+                tray.error(ErrorType.TYPE_ERROR,
+                           f"Method did not return a value: {method}",
+                           expression[0].line_num)
             else:
                 return service
         case [InterpreterBase.NEW_DEF, name] if isSWLN(name):
             try:
-                cuppa = classes[name]
+                cuppa = tray.classes[name]
             except KeyError:
-                error(ErrorType.TYPE_ERROR, f"Could not find class: {name}",
-                      expression[0].line_num)
-            return Ingredient(copy.copy(cuppa), error, trace_output)
+                tray.error(ErrorType.TYPE_ERROR,
+                           f"Could not find class: {name}",
+                           expression[0].line_num)
+            return Ingredient(copy.copy(cuppa), tray.error, tray.trace_output)
         case [unary_operator, sub_expression] if isSWLN(unary_operator):
-            grounds = evaluate_expression(sub_expression, me, super, classes,
-                                          stack, parameters, fields, error,
-                                          trace_output).value
-            if trace_output:
+            grounds = evaluate_expression(sub_expression, tray).value
+            if tray.trace_output:
                 debug(f"{unary_operator=} with {grounds=}:{type(grounds)}")
             match unary_operator:
-                case '!' if type(grounds) == bool:
+                case '!' if grounds.__class__ is bool:
                     roast = bool(not grounds)
                 case _:
-                    error(ErrorType.TYPE_ERROR,
+                    tray.error(ErrorType.TYPE_ERROR,
                         f"No use of {unary_operator} is compatible with "
                         f"expression type: {type(grounds)}",
                         unary_operator.line_num)
-            if trace_output:
+            if tray.trace_output:
                 debug(f"{type(roast)=}")
-            return Ingredient(roast, error, trace_output)
+            return BOOL_INGREDIENTS[roast]
         case [binary_operator, left_expression, right_expression] \
                 if isSWLN(binary_operator):
-            beans = evaluate_expression(left_expression, me, super, classes,
-                                        stack, parameters, fields, error,
-                                        trace_output)
+            beans = evaluate_expression(left_expression, tray)
             grounds = beans.value
-            milk = evaluate_expression(right_expression, me, super, classes,
-                                       stack, parameters, fields, error,
-                                       trace_output)
+            milk = evaluate_expression(right_expression, tray)
             cream = milk.value
-            if trace_output:
+            if tray.trace_output:
                 debug(f"{binary_operator=} with {grounds=}:{type(grounds)} and "
                       f"{cream=}:{type(cream)}")
+            if grounds.__class__ is int is cream.__class__:
+                operation = INT_OPERATIONS.get(binary_operator)
+            else:
+                operation = BINARY_OPERATIONS.get((binary_operator,
+                                                   type(grounds), type(cream)))
             match binary_operator:
-                # NOTE: `eval` only used after operator becomes known to prevent
-                #       arbitrary code execution
-                case '+'|'-'|'*'|'/'|'%' if type(grounds) == type(cream) == int:
-                    operator = eval(
-                        f'lambda left, right: left {binary_operator} right'
-                    )
-                    blend = int(operator(grounds, cream))
-                case '<'|'>'|'<='|'>='|'!='|'==' \
-                        if type(grounds) == type(cream) == int:
-                    operator = eval(
-                        f'lambda left, right: left {binary_operator} right'
-                    )
-                    blend = bool(operator(grounds, cream))
-                case '+' if type(grounds) == type(cream) == str:
-                    operator = eval(
-                        f'lambda left, right: left {binary_operator} right'
-                    )
-                    blend = str(operator(grounds, cream))
-                case '=='|'!='|'<'|'>'|'<='|'>=' \
-                        if type(grounds) == type(cream) == str:
-                    operator = eval(
-                        f'lambda left, right: left {binary_operator} right'
-                    )
-                    blend = bool(operator(grounds, cream))
-                case '!='|'==' if type(grounds) == type(cream) == bool:
-                    operator = eval(
-                        f'lambda left, right: left {binary_operator} right'
-                    )
-                    blend = bool(operator(grounds, cream))
-                case '&' if type(grounds) == type(cream) == bool:
-                    blend = bool(grounds and cream)
-                case '|' if type(grounds) == type(cream) == bool:
-                    blend = bool(grounds or cream)
-                case '==' if ((grounds is None or isinstance(grounds, Recipe))
-                              and (cream is None or isinstance(cream, Recipe))):
+                case _ if operation:
+                    blend = operation(grounds, cream)
+                case '==' | '!=' if (grounds.__class__ in OBJECT_CLASSES
+                                     and cream.__class__ in OBJECT_CLASSES):
                     if beans.btype:
-                        fragrance = classes[beans.btype]
+                        fragrance = tray.classes[beans.btype]
                     else:
                         fragrance = grounds
                     if milk.btype:
-                        flavor = classes[milk.btype]
+                        flavor = tray.classes[milk.btype]
                     else:
                         flavor = milk
                     try:
                         if not (fragrance.is_instance(flavor.name)
                                 or flavor.is_instance(fragrance.name)):
-                            error(ErrorType.TYPE_ERROR,
-                                  f"Classes {fragrance.name} and {flavor.name} "
-                                  f"are not related",
-                                  binary_operator.line_num)
+                            tray.error(ErrorType.TYPE_ERROR,
+                                       f"Classes {fragrance.name} and "
+                                       f"{flavor.name} are not related",
+                                       binary_operator.line_num)
                     except AttributeError:
                         pass
-                    blend = bool(grounds is cream)
-                case '!=' if ((grounds is None or isinstance(grounds, Recipe))
-                              and (cream is None or isinstance(cream, Recipe))):
-                    if beans.btype:
-                        fragrance = classes[beans.btype]
-                    else:
-                        fragrance = grounds
-                    if milk.btype:
-                        flavor = classes[milk.btype]
+                    if binary_operator == '==':
+                        blend = grounds is cream
                     else:
-                        flavor = milk
-                    try:
-                        if not (fragrance.is_instance(flavor.name)
-                                or flavor.is_instance(fragrance.name)):
-                            error(ErrorType.TYPE_ERROR,
-                                  f"Classes {fragrance.name} and {flavor.name} "
-                                  f"are not related",
-                                  binary_operator.line_num)
-                    except AttributeError:
-                        pass
-                    blend = bool(grounds is not cream)
+                        blend = grounds is not cream
                 case _:
-                    error(ErrorType.TYPE_ERROR,
+                    tray.error(ErrorType.TYPE_ERROR,
                         f"No use of {binary_operator} is compatible with "
                         f"expression types: {type(grounds)}, {type(cream)}",
                         binary_operator.line_num)
-            if trace_output:
+            if tray.trace_output:
                 debug(f"{type(blend)=}")
-            return Ingredient(blend, error, trace_output)
+            if blend.__class__ is bool:
+                return BOOL_INGREDIENTS[blend]
+            return Ingredient(blend, tray.error, tray.trace_output)
         case _:
-            error(ErrorType.SYNTAX_ERROR,
-                  f"Not a valid expression: {expression}")
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid expression: {expression}")
 
 
-def evaluate_statement(statement, me: Recipe, super: Recipe | None,
-                       classes: dict[SWLN, Recipe], stack: Plate | None,
-                       parameters: dict[SWLN, Tin], fields: dict[SWLN, Tin],
-                       get_input: InputFun, output: OutputFun, error: ErrorFun,
-                       trace_output: bool) -> Tuple[bool, None | Ingredient]:
+def evaluate_statement(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
     """
     Returns a tuple of the form (<if the method is returning>, <the boxed value
     of the return, if there is one>)
     """
-    if trace_output:
-        try:
-            debug(f"line {statement[0].line_num}: Running {statement[0]}")
-        except IndexError:
+    if tray.trace_output:
+        if statement == []:
             debug("Empty statement")
-        except AttributeError:
-            debug(f"no line_num: Running {statement[0]}")
+        else:
+            debug(f"{trace_line(statement)}: Running {first_token(statement)}")
+    try:
+        evaluate = STATEMENT_EVALUATORS[statement[0]]
+    except (KeyError, IndexError, TypeError):
+        tray.error(ErrorType.SYNTAX_ERROR,
+                   f"Not a valid statement: {statement}")
+    return evaluate(statement, tray)
+
+
+def evaluate_begin(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
     match statement:
-        case [InterpreterBase.BEGIN_DEF, *sub_statements] if sub_statements:
+        case [_, *sub_statements] if sub_statements:
             for sub_statement in sub_statements:
-                latest_order = evaluate_statement(sub_statement, me, super,
-                                                  classes, stack, parameters,
-                                                  fields, get_input, output,
-                                                  error, trace_output)
+                latest_order = evaluate_statement(sub_statement, tray)
                 if latest_order[0]:
                     return latest_order
-        case [InterpreterBase.CALL_DEF, expression, method, *arguments] \
-                if isSWLN(method):
-            beans = evaluate_expression(expression, me, super, classes, stack,
-                                        parameters, fields, error, trace_output)
-            cuppa = beans.value
-            if cuppa is None:
-                error(ErrorType.FAULT_ERROR,
-                      f"Trying to dereference nullptr", statement[0].line_num)
-            try:
-                cuppa.call_method(
-                    method,
-                    *(evaluate_expression(argument, me, super, classes, stack,
-                                          parameters, fields, error,
-                                          trace_output)
-                      for argument in arguments),
-                    first_call=not beans.is_super,
-                    me=me
-                )
-            except KeyError:
-                error(ErrorType.NAME_ERROR,
-                      f"Object does not have method: {method}", method.line_num)
-            except AttributeError:
-                error(ErrorType.TYPE_ERROR,
-                      f"Method being called on non-object",
-                      statement[0].line_num)
-            except ValueError:
-                error(ErrorType.NAME_ERROR,
-                      f"Method called with wrong number of arguments: {method}",
-                      statement[0].line_num)
-            except NameError as e:
-                error(ErrorType.NAME_ERROR, str(e), statement[0].line_num)
-            except TypeError as e:
-                error(ErrorType.TYPE_ERROR, str(e), statement[0].line_num)
-        case [InterpreterBase.IF_DEF, expression, true_statement]:
-            condition = evaluate_expression(expression, me, super, classes,
-                                            stack, parameters, fields, error,
-                                            trace_output).value
-            if type(condition) != bool:
-                error(ErrorType.TYPE_ERROR,
-                      "Condition did not evaluate to boolean",
-                      statement[0].line_num)
-            if condition:
-                order = evaluate_statement(true_statement, me, super, classes,
-                                           stack, parameters, fields, get_input,
-                                           output, error, trace_output)
-                if order[0]:
-                    return order
-        case [InterpreterBase.IF_DEF, expression, true_statement,
-              false_statement]:
-            condition = evaluate_expression(expression, me, super, classes,
-                                            stack, parameters, fields, error,
-                                            trace_output).value
-            if type(condition) != bool:
-                error(ErrorType.TYPE_ERROR,
-                      "Condition did not evaluate to boolean",
-                      statement[0].line_num)
-            if condition:
-                order = evaluate_statement(true_statement, me, super, classes,
-                                           stack, parameters, fields, get_input,
-                                           output, error, trace_output)
-                if order[0]:
-                    return order
-            else:
-                order = evaluate_statement(false_statement, me, super, classes,
-                                           stack, parameters, fields, get_input,
-                                           output, error, trace_output)
-                if order[0]:
-                    return order
-        case [InterpreterBase.INPUT_INT_DEF, variable] if isSWLN(variable):
-            if stack and (can := stack.get_variable(variable)):
-                pass
-            elif variable in parameters:
-                can = parameters[variable]
-            elif variable in fields:
-                can = fields[variable]
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_call(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, _, method, *_] if isSWLN(method):
+            evaluate_method_call(statement, tray)
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_if(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, expression, *branches] if 1 <= len(branches) <= 2:
+            condition = evaluate_expression(expression, tray).value
+            if condition is True:
+                order = evaluate_statement(branches[0], tray)
+            elif condition is not False:
+                tray.error(ErrorType.TYPE_ERROR,
+                           "Condition did not evaluate to boolean",
+                           statement[0].line_num)
+            elif len(branches) == 2:
+                order = evaluate_statement(branches[1], tray)
             else:
-                error(ErrorType.NAME_ERROR, f"Variable not found: {variable}",
-                      variable.line_num)
+                return False, None
+            if order[0]:
+                return order
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_input_int(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, variable] if isSWLN(variable):
+            can = tray.scope.get(variable) or tray.fields.get(variable)
+            if not can:
+                tray.error(ErrorType.NAME_ERROR,
+                           f"Variable not found: {variable}", variable.line_num)
             try:
-                beans = Ingredient(int(get_input()), error, trace_output)
+                beans = Ingredient(int(tray.get_input()), tray.error,
+                                   tray.trace_output)
             except ValueError:
-                error(ErrorType.TYPE_ERROR,
+                tray.error(ErrorType.TYPE_ERROR,
                         "Could not convert input to integer",
                         statement[0].line_num)
             except TypeError:
-                error(ErrorType.TYPE_ERROR, "Expected input but got none",
+                tray.error(ErrorType.TYPE_ERROR, "Expected input but got none",
                         statement[0].line_num)
             try:
                 can.set_value(beans)
             except TypeError as e:
-                error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
-        case [InterpreterBase.INPUT_STRING_DEF, variable] if isSWLN(variable):
-            if stack and (can := stack.get_variable(variable)):
-                pass
-            elif variable in parameters:
-                can = parameters[variable]
-            elif variable in fields:
-                can = fields[variable]
-            else:
-                error(ErrorType.NAME_ERROR, f"Variable not found: {variable}",
-                      variable.line_num)
-            beans = Ingredient(str(get_input()), error, trace_output)
+                tray.error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_input_string(statement,
+                          tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, variable] if isSWLN(variable):
+            can = tray.scope.get(variable) or tray.fields.get(variable)
+            if not can:
+                tray.error(ErrorType.NAME_ERROR,
+                           f"Variable not found: {variable}", variable.line_num)
+            beans = Ingredient(str(tray.get_input()), tray.error,
+                               tray.trace_output)
             try:
                 can.set_value(beans)
             except TypeError as e:
-                error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
-        case [InterpreterBase.PRINT_DEF, *arguments]:
-            if trace_output:
-                debug(output)
-            output(
-                ''.join(
-                    str(
-                        evaluate_expression(argument, me, super, classes, stack,
-                                            parameters, fields, error,
-                                            trace_output)
-                    )
-                    for argument in arguments
-                )
-            )
-        case [InterpreterBase.RETURN_DEF]:
+                tray.error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_print(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    _, *arguments = statement
+    if tray.trace_output:
+        debug(tray.output)
+    tray.output(''.join([str(evaluate_expression(argument, tray))
+                         for argument in arguments]))
+    return False, None
+
+
+def evaluate_return(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_]:
             return True, None
-        case [InterpreterBase.RETURN_DEF, expression]:
-            return True, evaluate_expression(expression, me, super, classes,
-                                             stack, parameters, fields, error,
-                                             trace_output)
-        case [InterpreterBase.SET_DEF, variable, expression] \
-                if isSWLN(variable):
-            if stack and (can := stack.get_variable(variable)):
-                pass
-            elif variable in parameters:
-                can = parameters[variable]
-            elif variable in fields:
-                can = fields[variable]
-            else:
-                error(ErrorType.NAME_ERROR, f"Variable not found: {variable}",
-                      variable.line_num)
-            beans = evaluate_expression(expression, me, super, classes, stack,
-                                        parameters, fields, error, trace_output)
+        case [_, expression]:
+            return True, evaluate_expression(expression, tray)
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+
+
+def evaluate_set(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, variable, expression] if isSWLN(variable):
+            can = tray.scope.get(variable) or tray.fields.get(variable)
+            if not can:
+                tray.error(ErrorType.NAME_ERROR,
+                           f"Variable not found: {variable}", variable.line_num)
+            beans = evaluate_expression(expression, tray)
             try:
                 can.set_value(beans)
             except TypeError as e:
-                error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
-        case [InterpreterBase.WHILE_DEF, expression, statement_to_run]:
+                tray.error(ErrorType.TYPE_ERROR, str(e), variable.line_num)
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_while(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, expression, statement_to_run]:
+            if (not tray.trace_output
+                    and count_loop(expression, statement_to_run, tray)):
+                return False, None
+            evaluate = body_evaluator(statement_to_run, tray.trace_output)
             while True:
-                condition = evaluate_expression(expression, me, super, classes,
-                                                stack, parameters, fields,
-                                                error, trace_output).value
-                if type(condition) != bool:
-                    error(ErrorType.TYPE_ERROR,
-                          "Condition did not evaluate to boolean",
-                          statement[0].line_num)
-                if not condition:
+                condition = evaluate_expression(expression, tray).value
+                if condition is False:
                     break
-                latest_order = evaluate_statement(statement_to_run, me, super,
-                                                  classes, stack, parameters,
-                                                  fields, get_input, output,
-                                                  error, trace_output)
-                if latest_order[0]:
-                    return latest_order
-        case [InterpreterBase.LET_DEF, var_defs, *sub_statements] \
-                if sub_statements:
-            stack = Plate(stack, me, classes, error, trace_output)
-            for var_def in var_defs:
-                match var_def:
-                    case [btype, name, value] \
-                            if isSWLN(btype) and isSWLN(name) and isSWLN(value):
-                        stack.add_variable(name, btype, value)
-                    case _:
-                        error(ErrorType.SYNTAX_ERROR,
-                              f"Malformed local variable: {var_def}",
-                              statement[0].line_num)
-            for sub_statement in sub_statements:
-                latest_order = evaluate_statement(sub_statement, me, super,
-                                                  classes, stack, parameters,
-                                                  fields, get_input, output,
-                                                  error, trace_output)
+                if condition is not True:
+                    tray.error(ErrorType.TYPE_ERROR,
+                               "Condition did not evaluate to boolean",
+                               statement[0].line_num)
+                latest_order = evaluate(statement_to_run, tray)
                 if latest_order[0]:
                     return latest_order
         case _:
-            error(ErrorType.SYNTAX_ERROR, f"Not a valid statement: {statement}")
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
+    return False, None
+
+
+def evaluate_let(statement, tray: Tray) -> Tuple[bool, None | Ingredient]:
+    match statement:
+        case [_, var_defs, *sub_statements] if sub_statements:
+            plate = Plate(tray.scope, tray.me, tray.classes, tray.error,
+                          tray.trace_output)
+            try:
+                for var_def in var_defs:
+                    match var_def:
+                        case tuple():
+                            plate.add_variable(*var_def)
+                        case [btype, name, value] if (isSWLN(btype)
+                                                      and isSWLN(name)
+                                                      and isSWLN(value)):
+                            plate.add_variable(name, btype, value)
+                        case _:
+                            tray.error(ErrorType.SYNTAX_ERROR,
+                                       f"Malformed local variable: {var_def}",
+                                       statement[0].line_num)
+                for sub_statement in sub_statements:
+                    latest_order = evaluate_statement(sub_statement, tray)
+                    if latest_order[0]:
+                        return latest_order
+            finally:
+                plate.clear()
+        case _:
+            tray.error(ErrorType.SYNTAX_ERROR,
+                       f"Not a valid statement: {statement}")
     return False, None
 
 
+STATEMENT_EVALUATORS = {
+    InterpreterBase.BEGIN_DEF: evaluate_begin,
+    InterpreterBase.CALL_DEF: evaluate_call,
+    InterpreterBase.IF_DEF: evaluate_if,
+    InterpreterBase.INPUT_INT_DEF: evaluate_input_int,
+    InterpreterBase.INPUT_STRING_DEF: evaluate_input_string,
+    InterpreterBase.PRINT_DEF: evaluate_print,
+    InterpreterBase.RETURN_DEF: evaluate_return,
+    InterpreterBase.SET_DEF: evaluate_set,
+    InterpreterBase.WHILE_DEF: evaluate_while,
+    InterpreterBase.LET_DEF: evaluate_let,
+}
+
+
 Interpreter = Barista
 
 
 def main():
-    interpreter = Interpreter(trace_output=True)
+    interpreter = Interpreter(trace_output=len(sys.argv) < 2)
     script = '''
 (class mammal (method person get_me () (return me))
 )
@@ -1024,6 +1231,9 @@ def main():
   )
 )
     '''
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as source:
+            script = source.read()
     try:
         interpreter.run(script.splitlines())
         print(interpreter.get_output())
@@ -182,3 +182,52 @@ second'''.splitlines())
         error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
         self.assertIs(error_type, ErrorType.NAME_ERROR)
         self.assertEqual(error_line, 19)
+
+    def test_separate_instances(self):
+        brewin = string_to_program('''
+            (class counter
+  (field int count 1)
+  (method void bump () (set count (+ count 1)))
+  (method int get () (return count))
+)
+
+(class tally inherits counter
+  (field string marks "|")
+  (method void bump () (begin (set marks (+ marks "|")) (call super bump)))
+  (method string show () (return marks))
+)
+
+(class main
+  (method void main ()
+    (let ((tally p null) (tally q null))
+      (set p (new tally))
+      (set q (new tally))
+      (call p bump)
+      (call p bump)
+      (call q bump)
+      (print (call p get) " " (call q get) " " (call p show) " " (call q show))
+    )
+  )
+)
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['3 2 ||| ||'])
+
+    def test_inherited_main_error(self):
+        brewin = string_to_program('''
+            (class base
+  (method int main () (return "x"))
+)
+
+(class main inherits base)
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 2)
@@ -1,8 +1,8 @@
 import unittest
 
-from bparser import string_to_program
+from bparser import string_to_program, StringWithLineNumber
 from intbase import ErrorType
-from interpreterv2 import Interpreter
+from interpreterv2 import Interpreter, let_value
 
 
 class TestEverything(unittest.TestCase):
@@ -122,3 +122,94 @@ true
         output = self.deaf_interpreter.get_output()
 
         self.assertEqual(output, '''sis'''.splitlines())
+
+    def test_null_object_local(self):
+        brewin = string_to_program('''
+            (class main
+  (method void main ()
+    (let ((main other null))
+      (print (== other null))
+    )
+  )
+)
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['true'])
+
+    def test_null_primitive_local(self):
+        brewin = string_to_program('''
+            (class main
+  (method void main ()
+    (let ((int x null))
+      (print x)
+    )
+  )
+)
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 3)
+
+    def test_mismatched_value_line(self):
+        brewin = string_to_program('''
+            (class main
+  (method void main ()
+    (let ((string y
+            5))
+      (print y)
+    )
+  )
+)
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 4)
+
+    def test_mismatched_local(self):
+        brewin = string_to_program('''
+            (class main
+  (method void main ()
+    (let ((int x 0)
+          (string y 5))
+      (print x y)
+    )
+  )
+)
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 4)
+
+
+class TestLetValue(unittest.TestCase):
+    def test_matching_primitives(self):
+        self.assertEqual(let_value(StringWithLineNumber('int', 0),
+                                   StringWithLineNumber('-12', 0)), -12)
+        self.assertEqual(let_value(StringWithLineNumber('string', 0),
+                                   StringWithLineNumber('"hi"', 0)), 'hi')
+        self.assertIs(let_value(StringWithLineNumber('bool', 0),
+                                StringWithLineNumber('true', 0)), True)
+
+    def test_null_object(self):
+        self.assertIsNone(let_value(StringWithLineNumber('main', 0),
+                                    StringWithLineNumber('null', 0)))
+
+    def test_left_as_token(self):
+        for btype, value in (('int', 'null'), ('int', '"5"'), ('bool', '0'),
+                             ('main', '5'), ('int', 'x')):
+            token = StringWithLineNumber(value, 4)
+            self.assertIs(let_value(StringWithLineNumber(btype, 4), token),
+                          token)
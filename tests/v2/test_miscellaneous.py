@@ -108,6 +108,65 @@ class TestMethods(unittest.TestCase):
         self.assertIs(error_type, ErrorType.NAME_ERROR)
         self.assertEqual(error_line, 2)
 
+    def test_bool_results(self):
+        brewin = string_to_program('''
+            (class main
+                (field bool a true)
+                (field bool b false)
+                (method bool unset () (print "unset"))
+                (method void main ()
+                    (begin
+                        (set a (< 1 2))
+                        (set b (! a))
+                        (print a " " b " " (call me unset))
+                        (set a (== a b))
+                        (print a " " b " " (| a (! b)))
+                    )
+                )
+            )
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['unset', 'true false false',
+                                  'false false true'])
+
+    def test_logical_operands_evaluated(self):
+        brewin = string_to_program('''
+            (class main
+                (method bool loud ((bool b)) (begin (print "loud") (return b)))
+                (method void main ()
+                    (begin
+                        (print (& false (call me loud true)))
+                        (print (| true (call me loud false)))
+                    )
+                )
+            )
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['loud', 'false', 'loud', 'true'])
+
+    def test_logical_operand_type(self):
+        brewin = string_to_program('''
+            (class main
+                (method void main ()
+                    (print (| true 1))
+                )
+            )
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 3)
+
 
 class TestWhile(unittest.TestCase):
     def setUp(self) -> None:
@@ -433,3 +492,77 @@ Running...
 8
 Running...
 4'''.splitlines())
+
+    def test_nested_begin_return(self):
+        brewin = string_to_program('''
+            (class main
+  (method int find ((int n))
+    (begin
+      (begin
+        (print "searching")
+        (begin
+          (while (> n 0)
+            (begin
+              (begin
+                (if (== n 3)
+                  (begin (begin (return n)))
+                )
+              )
+              (set n (- n 1))
+            )
+          )
+        )
+      )
+      (print "not found")
+      (return -1)
+    )
+  )
+  (method void main ()
+    (begin
+      (print (call me find 5))
+      (print (call me find 2))
+    )
+  )
+)
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, '''searching
+3
+searching
+not found
+-1'''.splitlines())
+
+    def test_counting_loops(self):
+        brewin = string_to_program('''
+            (class main
+                (field int n 10)
+                (method void main ()
+                    (let ((int i 0) (int j 10) (int k 3) (string s "s"))
+                        (while (< i n) (set i (+ i 3)))
+                        (while (>= j 0) (begin (set j (- j 4))))
+                        (while (<= k 2) (set k (+ k 1)))
+                        (while (> n 3) (set n (- n k)))
+                        (while (< k 5) (set k (+ k k)))
+                        (print i " " j " " k " " n)
+                        (set i 0)
+                        (while (< i 3)
+                            (begin
+                                (set i (+ i 1))
+                                (set s (+ s "s"))
+                            )
+                        )
+                        (print i " " s)
+                    )
+                )
+            )
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['12 -2 6 1', '3 ssss'])
@@ -377,3 +377,27 @@ all good'''.splitlines())
         output = self.deaf_interpreter.get_output()
 
         self.assertEqual(output, '''all good'''.splitlines())
+
+    def test_let_unwound_by_throw(self):
+        brewin = string_to_program('''
+            (class main
+  (method void main ()
+    (let ((string x "outer"))
+      (try
+        (let ((string x "inner") (int y 5))
+          (throw x)
+        )
+        (print exception " " x)
+      )
+      (print x)
+    )
+  )
+)
+      ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, '''inner outer
+outer'''.splitlines())
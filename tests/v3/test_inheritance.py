@@ -0,0 +1,43 @@
+import unittest
+
+from bparser import string_to_program
+from intbase import ErrorType
+from interpreterv3 import Interpreter
+
+
+class TestEverything(unittest.TestCase):
+    def setUp(self) -> None:
+        self.deaf_interpreter = Interpreter(console_output=False, inp=[], trace_output=False)
+
+    def test_inherited_main(self):
+        brewin = string_to_program('''
+            (class base
+  (method void main () (print "hello from " (call me name)))
+  (method string name () (return "base"))
+)
+
+(class main inherits base
+  (method string name () (return "main"))
+)
+        ''')
+
+        self.deaf_interpreter.reset()
+        self.deaf_interpreter.run(brewin)
+        output = self.deaf_interpreter.get_output()
+
+        self.assertEqual(output, ['hello from main'])
+
+    def test_inherited_main_error(self):
+        brewin = string_to_program('''
+            (class base
+  (method int main () (return "x"))
+)
+
+(class main inherits base)
+        ''')
+
+        self.assertRaises(RuntimeError, self.deaf_interpreter.run, brewin)
+
+        error_type, error_line = self.deaf_interpreter.get_error_type_and_line()
+        self.assertIs(error_type, ErrorType.TYPE_ERROR)
+        self.assertEqual(error_line, 2)